@@ -0,0 +1,30 @@
+"""
+Einmalige Konvertierung der Retail-CSV nach Parquet.
+
+Parquet mit zstd liest sich 3-50x günstiger als die CSV — Pipeline und
+Tests können danach data/online_retail.parquet direkt an DataCleaner
+übergeben (load_data erkennt die Endung).
+
+Aufruf:
+    python scripts/convert_to_parquet.py [csv_pfad] [parquet_pfad]
+"""
+import sys
+
+import pandas as pd
+
+DEFAULT_CSV = "data/online_retail.csv"
+DEFAULT_PARQUET = "data/online_retail.parquet"
+
+
+def main() -> None:
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV
+    parquet_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PARQUET
+
+    df = pd.read_csv(csv_path, low_memory=False)
+    df.to_parquet(parquet_path, engine="pyarrow", compression="zstd", index=False)
+
+    print(f"{len(df)} Zeilen: '{csv_path}' → '{parquet_path}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Contains dataclass-based configuration for database, logging, and application se
 """
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from dotenv import load_dotenv
 
 
@@ -36,3 +37,36 @@ class AppConfig:
     """Application configuration"""
 
     DATA_PATH: str = os.getenv("DATA_PATH", "data/online_retail.csv")
+
+
+# Lazy Config-Factories mit Cache:
+# Die Klassen-Defaults oben werden EINMAL beim Import ausgewertet.
+# Die Factories lesen die Environment Variables erst beim ersten Aufruf
+# (also NACH load_dotenv beim Consumer) und cachen das Ergebnis —
+# kein erneutes os.getenv/int() bei jedem Zugriff.
+# Bei geänderter Umgebung (z.B. in Tests): get_db_config.cache_clear().
+@lru_cache(maxsize=1)
+def get_db_config() -> DatabaseConfig:
+    """Gibt die (gecachte) Datenbank-Konfiguration zurück"""
+    return DatabaseConfig(
+        HOST=os.getenv("DATABASE_HOST", "localhost"),
+        PORT=int(os.getenv("DATABASE_PORT", "5432")),
+        NAME=os.getenv("DATABASE_NAME", "bi_pipeline"),
+        USER=os.getenv("DATABASE_USER", "admin"),
+        PASSWORD=os.getenv("DATABASE_PASSWORD", "secret"),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_logging_config() -> LoggingConfig:
+    """Gibt die (gecachte) Logging-Konfiguration zurück"""
+    return LoggingConfig(
+        FORMAT=os.getenv("LOG_FORMAT", "text"),
+        LEVEL=os.getenv("LOG_LEVEL", "INFO"),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_app_config() -> AppConfig:
+    """Gibt die (gecachte) Anwendungs-Konfiguration zurück"""
+    return AppConfig(DATA_PATH=os.getenv("DATA_PATH", "data/online_retail.csv"))
@@ -2,36 +2,366 @@
 Data cleaning module for ETL pipeline.
 Handles data loading, missing value treatment, type optimization, and database operations.
 """
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+import numpy as np
 import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.dataset as pads
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from src.logger import get_logger
 
 
+# Arrow Column-Types für den Online-Retail Datensatz
+# (explizite Typen sparen die Typ-Inferenz beim Laden)
+_ARROW_COLUMN_TYPES = {
+    "InvoiceNo": "string",
+    "StockCode": "string",
+    "Description": "string",
+    "Quantity": "int32",
+    "UnitPrice": "float32",
+    "CustomerID": "float32",
+    "Country": "string",
+}
+
+# Bekannte Timestamp-Formate (Online-Retail + ISO)
+_TIMESTAMP_PARSERS = ["%m/%d/%Y %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]
+
+# Pandas-Dtypes für den Online-Retail Datensatz
+# (vordefinierte Typen sparen die Inferenz-Pässe von read_csv)
+_RETAIL_DTYPES = {
+    "InvoiceNo": "string",
+    "StockCode": "category",
+    "Description": "string",
+    "Quantity": "int32",
+    "UnitPrice": "float32",
+    "CustomerID": "float32",
+    "Country": "category",
+}
+
+# Spalten die read_csv direkt als datetime parsen soll
+_RETAIL_DATE_COLS = ["InvoiceDate"]
+
+# Bekannte Datum-Formate pro Spalte (C-strptime-Fastpath statt
+# dateutil-Inferenz pro Zelle)
+_DATE_FORMATS = {"InvoiceDate": "%m/%d/%Y %H:%M"}
+
+# Vorcompilierter Namens-Match für Datum-Spalten (ein re.search statt
+# zwei lower()+in-Checks pro Spalte; fängt auch timestamp/_dt/_at)
+_DATE_NAME_RE = re.compile(r"(date|time|timestamp|_dt)$|^dt_|_at$", re.I)
+
+
+def _fast_to_datetime(series: pd.Series, fmt: Optional[str] = None) -> pd.Series:
+    """
+    Parst eine String-Spalte zu datetime über ihre EINDEUTIGEN Werte.
+
+    Retail-Daten haben viele Zeilen pro Timestamp (eine Rechnung =
+    viele Positionen). Statt jeden String erneut durch strptime zu
+    schicken, werden nur die Unique-Werte geparst und per map
+    zurückgeschrieben — bei ~23k Timestamps auf 500k Zeilen ~22x
+    weniger Parse-Arbeit.
+    """
+    uniq = series.dropna().unique()
+    parsed = pd.to_datetime(uniq, format=fmt, errors="coerce")
+    mapping = dict(zip(uniq, parsed))
+    return series.map(mapping)
+
+
+def _scan_numeric(arr: np.ndarray) -> tuple:
+    """
+    Ein fusionierter Scan über eine Float-Spalte:
+    NaN-Maske, Anzahl fehlender Werte und Median in einem Durchlauf.
+
+    Spart die getrennten isnull()/median()-Pässe (memory-bound,
+    Bandbreiten-Reduktion = Wallclock-Reduktion).
+
+    Returns:
+        (mask, n_missing, median) — median ist None wenn alles NaN ist
+    """
+    mask = np.isnan(arr)
+    n_missing = int(mask.sum())
+    valid = arr[~mask] if n_missing else arr
+    median = float(np.median(valid)) if valid.size else None
+    return mask, n_missing, median
+
+
+def _analyze_float(arr: np.ndarray) -> tuple:
+    """
+    Ein fusionierter Scan über eine Float-Spalte für das Downcasting:
+    Min, Max, Ganzzahl- und Null-Check in einem Durchlauf statt
+    getrennten Pässen (min, max, is-integer, isna).
+
+    Returns:
+        (col_min, col_max, is_int, has_nulls) —
+        (0, 0, True, False) bei leerer Spalte
+    """
+    finite = arr[np.isfinite(arr)]
+    has_nulls = finite.size != arr.size
+    if finite.size == 0:
+        return 0, 0, True, has_nulls
+    return (
+        finite.min(),
+        finite.max(),
+        bool(np.all(np.floor(finite) == finite)),
+        has_nulls,
+    )
+
+
 class DataCleaner:
     """
     Eine Klasse zum Bereinigen von E-Commerce Daten.
     """
 
-    def __init__(self, filepath: str):
+    def __init__(
+        self,
+        filepath: str,
+        use_parquet_cache: bool = False,
+        dtype_map: Optional[dict] = None,
+        category_threshold: float = 0.5,
+        verbose_memory: bool = False,
+    ):
         """
         Initialisiert den DataCleaner mit einem Dateipfad.
 
         Args:
             filepath: Pfad zur CSV-Datei
+            use_parquet_cache: Bereinigte Daten als Parquet neben der CSV
+                cachen und bei Reruns direkt daraus laden (20-50x schneller
+                als erneutes CSV-Parsen)
+            dtype_map: Spalte → pandas-Dtype für CSVs mit bekanntem Schema;
+                ersetzt die Retail-Defaults und spart die Typ-Inferenz
+                beim Laden komplett
+            category_threshold: Object-Spalten mit nunique/len unter
+                diesem Wert werden zu category konvertiert (int-Codes
+                statt Python-String-Pointer)
+            verbose_memory: Exakte Memory-Zahlen im Report
+                (memory_usage(deep=True) läuft über jedes String-Objekt
+                — auf grossen Frames selbst sekundenlang)
         """
         self.filepath = filepath
+        self.use_parquet_cache = use_parquet_cache
+        self.dtype_map = dtype_map
+        self.category_threshold = category_threshold
+        self._verbose_memory = verbose_memory
         self.data: Optional[pd.DataFrame] = None
         self.logger = get_logger(__name__)
 
+    def _cached_parquet_path(self) -> str:
+        """Pfad der Parquet-Cache-Datei neben der CSV"""
+        return self.filepath + ".parquet"
+
+    def _load_from_parquet_cache(self) -> Optional[pd.DataFrame]:
+        """
+        Lädt den Parquet-Cache, falls er existiert und neuer als
+        die CSV ist. Sonst None.
+        """
+        cached = self._cached_parquet_path()
+        if os.path.exists(cached) and os.path.getmtime(cached) > os.path.getmtime(
+            self.filepath
+        ):
+            self.logger.info(f"Lade Parquet-Cache: '{cached}'")
+            return pd.read_parquet(cached)
+        return None
+
+    def cache_to_parquet(self) -> None:
+        """
+        Schreibt die (bereinigten) Daten als Parquet-Cache neben die CSV.
+
+        Parquet mit zstd ist typischerweise 5-10x kleiner und
+        20-50x schneller zu laden als die CSV — Reruns der Pipeline
+        überspringen damit Parsen UND Bereinigung.
+        """
+        if self.data is None:
+            self.logger.error("Keine Daten zum Cachen geladen.")
+            return
+        cached = self._cached_parquet_path()
+        self.data.to_parquet(cached, compression="zstd", index=False)
+        self.logger.info(f"Parquet-Cache geschrieben: '{cached}'")
+
+    def _read_csv_arrow(self) -> pd.DataFrame:
+        """
+        Liest die CSV-Datei mit pyarrow (multithreaded, SIMD-Tokenizer).
+
+        Deutlich schneller als pd.read_csv, weil Arrow die Datei
+        blockweise parallel parst und für numerische Spalten
+        zero-copy nach pandas konvertiert.
+        """
+        read_options = pacsv.ReadOptions(block_size=64 << 20, use_threads=True)
+        convert_options = pacsv.ConvertOptions(
+            column_types={
+                col: pa.type_for_alias(alias)
+                for col, alias in _ARROW_COLUMN_TYPES.items()
+            },
+            timestamp_parsers=_TIMESTAMP_PARSERS,
+        )
+        # Memory-Mapping: das OS liefert die Datei zero-copy an den
+        # Tokenizer statt über Kernel→User-Puffer-Kopien
+        source = pa.memory_map(self.filepath, "r")
+        table = pacsv.read_csv(
+            source, read_options=read_options, convert_options=convert_options
+        )
+        return table.to_pandas(self_destruct=True)
+
+    def _read_csv_pandas(self) -> pd.DataFrame:
+        """
+        Liest die CSV-Datei mit pd.read_csv und vordefinierten Dtypes.
+
+        Explizite Typen + parse_dates vermeiden die doppelte
+        Inferenz-Passage über die Datei (bis zu 50% schneller).
+        Dtype-Map wird auf die tatsächlich vorhandenen Spalten gefiltert,
+        damit auch fremde CSVs geladen werden können.
+        """
+        header = pd.read_csv(self.filepath, nrows=0)
+        dtype_map = self.dtype_map or _RETAIL_DTYPES
+        dtypes = {c: t for c, t in dtype_map.items() if c in header.columns}
+        date_cols = [c for c in _RETAIL_DATE_COLS if c in header.columns]
+        return pd.read_csv(
+            self.filepath,
+            dtype=dtypes,
+            parse_dates=date_cols,
+            engine="c",
+            low_memory=False,
+            memory_map=True,
+        )
+
+    def stream_batches(self, batch_size: int = 100_000):
+        """
+        Streamt die CSV-Datei als pyarrow RecordBatches.
+
+        Für Dateien die nicht komplett in den RAM passen:
+        Peak-Memory ist O(batch_size) statt O(Dateigröße). Jeder Batch
+        kann einzeln bereinigt und per COPY in die DB geschrieben werden.
+
+        Args:
+            batch_size: Zeilen pro RecordBatch
+
+        Yields:
+            pa.RecordBatch mit batch_size Zeilen
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                "pyarrow wird fuer stream_batches benoetigt (pip install pyarrow)"
+            )
+
+        convert_options = pacsv.ConvertOptions(
+            column_types={
+                col: pa.type_for_alias(alias)
+                for col, alias in _ARROW_COLUMN_TYPES.items()
+            },
+            timestamp_parsers=_TIMESTAMP_PARSERS,
+        )
+        dataset = pads.dataset(
+            self.filepath,
+            format=pads.CsvFileFormat(convert_options=convert_options),
+        )
+
+        self.logger.info(
+            f"Streame '{self.filepath}' in Batches von {batch_size} Zeilen"
+        )
+        yield from dataset.to_batches(batch_size=batch_size)
+
+    def iter_clean(self, chunksize: int = 500_000, table_name: Optional[str] = None):
+        """
+        Streamt die CSV-Datei in Chunks durch die komplette Bereinigung.
+
+        Für Dateien die nicht in den RAM passen: Peak-Memory ist
+        O(chunksize) statt O(Dateigröße). Jeder Chunk durchläuft
+        handle_missing_values + correct_datatypes und wird optional
+        per COPY an die Zieltabelle angehängt (erster Chunk ersetzt
+        die Tabelle, alle weiteren appenden).
+
+        Hinweis: Median/Mode werden PRO CHUNK berechnet — bei
+        hinreichend grossen Chunks ist die Abweichung zur globalen
+        Statistik vernachlässigbar.
+
+        Args:
+            chunksize: Zeilen pro Chunk
+            table_name: Optionale Zieltabelle für den COPY-Append
+
+        Yields:
+            Bereinigter DataFrame pro Chunk
+        """
+        from src.db import get_engine
+        from src.db_connector import DatabaseConnector
+
+        header = pd.read_csv(self.filepath, nrows=0)
+        dtype_map = self.dtype_map or _RETAIL_DTYPES
+        dtypes = {c: t for c, t in dtype_map.items() if c in header.columns}
+        date_cols = [c for c in _RETAIL_DATE_COLS if c in header.columns]
+
+        db = DatabaseConnector(engine=get_engine()) if table_name else None
+        self.logger.info(
+            f"Streame '{self.filepath}' in Chunks von {chunksize} Zeilen"
+        )
+
+        try:
+            reader = pd.read_csv(
+                self.filepath,
+                dtype=dtypes,
+                parse_dates=date_cols,
+                engine="c",
+                low_memory=False,
+                chunksize=chunksize,
+            )
+            for i, chunk in enumerate(reader):
+                self.data = chunk
+                self.handle_missing_values()
+                self.correct_datatypes()
+                if db is not None:
+                    db.copy_dataframe(
+                        self.data,
+                        table_name,
+                        if_exists="replace" if i == 0 else "append",
+                    )
+                yield self.data
+        finally:
+            if db is not None:
+                db.close()
+
     def load_data(self) -> Optional[pd.DataFrame]:
         """
         Lädt die CSV-Datei in einen pandas DataFrame mit Error Handling.
 
+        Nutzt pyarrow.csv (multithreaded) falls verfügbar,
+        sonst Fallback auf pd.read_csv.
+
         Returns:
             DataFrame mit den geladenen Daten oder None bei Fehler
         """
         try:
-            self.data = pd.read_csv(self.filepath)
+            # Parquet-Cache (falls aktiviert und aktueller als die CSV)
+            if self.use_parquet_cache:
+                cached_df = self._load_from_parquet_cache()
+                if cached_df is not None:
+                    self.data = cached_df
+                    return self.data
+
+            # Parquet-Dateien direkt lesen (kein CSV-Tokenizing nötig,
+            # siehe scripts/convert_to_parquet.py für die Konvertierung)
+            if self.filepath.endswith(".parquet"):
+                self.data = pd.read_parquet(self.filepath)
+            elif PYARROW_AVAILABLE:
+                try:
+                    self.data = self._read_csv_arrow()
+                except pa.ArrowInvalid as e:
+                    # z.B. unerwartetes Format → Fallback auf pandas Parser
+                    self.logger.warning(
+                        f"pyarrow konnte CSV nicht parsen ({e}), Fallback auf pandas"
+                    )
+                    self.data = self._read_csv_pandas()
+            else:
+                self.data = self._read_csv_pandas()
+
             self.logger.info(
                 f"Daten geladen: {len(self.data)} Zeilen, {len(self.data.columns)} Spalten"
             )
@@ -77,12 +407,17 @@ class DataCleaner:
             total_rows = len(self.data)
             missing_percent = (missing_count / total_rows) * 100
 
-            self.logger.info("=== Analyse fehlender Werte ===")
-            for col in self.data.columns:
-                if missing_count[col] > 0:
-                    self.logger.info(
-                        f"{col}: {missing_count[col]} ({missing_percent[col]:.2f}%)"
-                    )
+            # Nur Spalten mit fehlenden Werten betrachten — spart die
+            # per-Spalte-Indexierung missing_count[col] in den Schleifen
+            missing_cols = missing_count[missing_count > 0].index
+
+            # Report-Zeilen sammeln und als EINEN Log-Record ausgeben
+            # (ein Flush/Syscall statt einem pro Spalte)
+            report = ["=== Analyse fehlender Werte ==="]
+            for col in missing_cols:
+                report.append(
+                    f"{col}: {missing_count[col]} ({missing_percent[col]:.2f}%)"
+                )
 
             # Warnung bei Spalten mit >50% fehlenden Werten
             critical_cols = missing_percent[missing_percent > 50]
@@ -91,39 +426,112 @@ class DataCleaner:
                 for col in critical_cols.index:
                     self.logger.warning(f"  - {col}: {critical_cols[col]:.2f}%")
 
-            self.logger.info("=== Behandlung fehlender Werte ===")
+            report.append("=== Behandlung fehlender Werte ===")
 
-            # Numerische Spalten: Mit Median füllen
+            # Fill-Werte für alle Spalten in EINEM Dict sammeln:
+            # Numerische Spalten → Median, kategorische → Mode oder "Unknown".
+            # Ein einziger fillna(dict)-Aufruf statt einer Kopie pro Spalte
+            # (inplace=True triggert unter pandas CoW eine Block-Kopie je Spalte).
             numeric_cols = self.data.select_dtypes(include=["number"]).columns
-            for col in numeric_cols:
-                if missing_count[col] > 0:
-                    median_value = self.data[col].median()
-                    self.data[col].fillna(median_value, inplace=True)
-                    self.logger.info(
-                        f"{col} (numerisch): Gefuellt mit Median ({median_value:.2f})"
-                    )
+            # "object" allein matcht weder string- noch category-Spalten
+            # (die Retail-Dtypes!) — alle String-Varianten explizit wählen
+            categorical_cols = self.data.select_dtypes(
+                include=["object", "string", "category"]
+            ).columns
 
-            # Kategorische Spalten: Mit Mode oder "Unknown" füllen
-            categorical_cols = self.data.select_dtypes(include=["object"]).columns
-            for col in categorical_cols:
-                if missing_count[col] > 0:
-                    if not self.data[col].mode().empty:
-                        mode_value = self.data[col].mode()[0]
-                        self.data[col].fillna(mode_value, inplace=True)
-                        self.logger.info(
-                            f"{col} (kategorisch): Gefuellt mit Mode ('{mode_value}')"
-                        )
+            fill_map = {}
+            filled_report = {}
+            filled_total = 0
+
+            # Float-Spalten: Maske + Median in EINEM Scan,
+            # dann np.putmask direkt auf dem ndarray in C
+            # (eine Kopie wegen CoW, dann in-place Fill)
+            float_cols = []
+            for col in numeric_cols.intersection(missing_cols):
+                if self.data[col].dtype.kind == "f":
+                    float_cols.append(col)
+                else:
+                    # Nullable Int & Co.: weiter über fillna.
+                    # Komplett leere Spalte → Median ist <NA>, fillna
+                    # wäre ein No-op (gleicher Guard wie bei den Floats)
+                    median_value = self.data[col].median()
+                    if pd.notna(median_value):
+                        fill_map[col] = median_value
+                        filled_total += int(missing_count[col])
+
+            def _fill_float(col):
+                arr = self.data[col].to_numpy(copy=True)
+                mask, _, median_value = _scan_numeric(arr)
+                if median_value is not None:
+                    np.putmask(arr, mask, median_value)
+                return col, arr, median_value
+
+            # Die Scans/Fills sind pro Spalte unabhängig und numpy gibt
+            # den GIL frei → über die Spalten thread-parallelisieren.
+            if len(float_cols) > 1:
+                workers = min(os.cpu_count() or 1, len(float_cols))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    fill_results = list(executor.map(_fill_float, float_cols))
+            else:
+                fill_results = [_fill_float(col) for col in float_cols]
+
+            # Zuweisungen seriell im Main-Thread (Block-Manager ist
+            # nicht threadsafe)
+            for col, arr, median_value in fill_results:
+                if median_value is None:
+                    continue
+                self.data[col] = arr
+                filled_report[col] = median_value
+                filled_total += int(missing_count[col])
+
+            # Modes für ALLE betroffenen kategorischen Spalten in EINEM
+            # DataFrame-Aufruf statt einer Sortierung pro Spalte
+            affected_cat = categorical_cols.intersection(missing_cols)
+            if len(affected_cat):
+                cat_modes = (
+                    self.data[affected_cat].mode(dropna=True)
+                    if total_rows
+                    else pd.DataFrame()
+                )
+                for col in affected_cat:
+                    if len(cat_modes) and pd.notna(cat_modes[col].iloc[0]):
+                        fill_map[col] = cat_modes[col].iloc[0]
                     else:
-                        self.data[col].fillna("Unknown", inplace=True)
-                        self.logger.info(f"{col} (kategorisch): Gefuellt mit 'Unknown'")
+                        # Spalte komplett leer → kein Mode vorhanden
+                        fill_map[col] = "Unknown"
+                        # category kennt "Unknown" noch nicht → erst als
+                        # Kategorie registrieren, sonst wirft fillna
+                        if isinstance(self.data[col].dtype, pd.CategoricalDtype):
+                            self.data[col] = self.data[col].cat.add_categories(
+                                ["Unknown"]
+                            )
+                    filled_total += int(missing_count[col])
+
+            if fill_map:
+                self.data = self.data.fillna(fill_map)
+
+            # Reporting nach dem Füllen (eine Zeile pro betroffener Spalte)
+            for col, value in {**filled_report, **fill_map}.items():
+                if col in numeric_cols:
+                    report.append(
+                        f"{col} (numerisch): Gefuellt mit Median ({value:.2f})"
+                    )
+                else:
+                    report.append(f"{col} (kategorisch): Gefuellt mit '{value}'")
 
-            # Finale Prüfung
-            remaining_missing = self.data.isnull().sum().sum()
-            self.logger.info(
+            # Finale Prüfung per Buchhaltung statt erneutem
+            # isnull().sum().sum()-Scan über den ganzen Frame
+            remaining_missing = int(missing_count.sum()) - filled_total
+            report.append(
                 f"Behandlung abgeschlossen. Verbleibende fehlende Werte: {remaining_missing}. "
                 f"Verbleibende Zeilen: {len(self.data)}"
             )
 
+            # Gesamter Report als EIN Log-Record (join nur wenn INFO
+            # überhaupt emittiert wird)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("%s", "\n".join(report))
+
             return self.data
 
         except Exception as e:
@@ -132,6 +540,35 @@ class DataCleaner:
             )
             return None
 
+    def _to_datetime(self, col: str) -> pd.Series:
+        """
+        Konvertiert eine Spalte zu datetime.
+
+        Für Spalten mit bekanntem Format (_DATE_FORMATS) wird der
+        vektorisierte C-strptime-Pfad genutzt statt der langsamen
+        Format-Inferenz pro Zelle. Ohne bekanntes Format wird das
+        Format EINMAL vom ersten Non-Null-Wert geraten
+        (guess_datetime_format) statt pro Zelle. Koerziert das Format
+        auch nur einen Wert zu NaT (z.B. gemischte Formate in einer
+        Spalte), wird einmal mit per-Wert-Inferenz (format="mixed")
+        nachgeparst.
+        """
+        series = self.data[col]
+        fmt = _DATE_FORMATS.get(col)
+        if fmt is None:
+            sample = series.dropna()
+            if len(sample):
+                fmt = pd.tseries.api.guess_datetime_format(str(sample.iloc[0]))
+        if fmt is not None:
+            parsed = _fast_to_datetime(series, fmt)
+            # Nur akzeptieren wenn KEIN Wert zusätzlich zu NaT wurde —
+            # sonst verliert der Fastpath Daten, die die Inferenz parst
+            if parsed.isna().sum() == series.isna().sum():
+                return parsed
+        # format="mixed" inferiert pro Wert (wie der Content-Sniff) —
+        # nötig für Spalten die mehrere Formate mischen
+        return _fast_to_datetime(series, "mixed")
+
     def correct_datatypes(self) -> Optional[pd.DataFrame]:
         """
         Korrigiert und optimiert Datentypen im DataFrame.
@@ -147,23 +584,47 @@ class DataCleaner:
             return None
 
         try:
-            self.logger.info("=== Datentypen-Optimierung ===")
+            # Report-Zeilen sammeln und als EINEN Log-Record ausgeben
+            # (ein Flush/Syscall statt einem pro Spalte)
+            report = ["=== Datentypen-Optimierung ==="]
 
             # Memory Usage vorher
-            memory_before = self.data.memory_usage(deep=True).sum() / 1024**2  # in MB
-            self.logger.info(f"Memory-Verbrauch vorher: {memory_before:.2f} MB")
-
-            self.logger.info("Datentypen vorher:")
-            self.logger.info(f"\n{self.data.dtypes}")
+            memory_before = (
+                self.data.memory_usage(deep=self._verbose_memory).sum() / 1024**2
+            )  # in MB
+            report.append(f"Memory-Verbrauch vorher: {memory_before:.2f} MB")
+            # dtypes-Repr nur stringifizieren wenn INFO überhaupt emittiert
+            # wird (DataFrame.__repr__ ist bei breiten Schemas teuer)
+            if self.logger.isEnabledFor(logging.INFO):
+                report.append(f"Datentypen vorher:\n{self.data.dtypes}")
 
             # 1. Datum-Spalten konvertieren
-            self.logger.info("--- Datum-Spalten konvertieren ---")
+            report.append("--- Datum-Spalten konvertieren ---")
             date_cols_converted = 0
             for col in self.data.columns:
-                if "date" in col.lower() or "time" in col.lower():
+                # Parser-seitig bereits konvertiert (read_csv/pyarrow)?
+                # Dann keinen zweiten to_datetime-Pass machen.
+                if pd.api.types.is_datetime64_any_dtype(self.data[col]):
+                    report.append(f"'{col}' ist bereits datetime")
+                    date_cols_converted += 1
+                    continue
+
+                # Namens-Match, sonst Content-Sniff auf einem 1000er-Sample
+                # (nur für object-Spalten, erspart false negatives bei
+                # ISO-Strings in unkonventionell benannten Spalten)
+                is_date = bool(_DATE_NAME_RE.search(col))
+                if not is_date and self.data[col].dtype == object:
+                    sample = self.data[col].dropna().head(1000)
+                    if len(sample):
+                        parsed = pd.to_datetime(
+                            sample, errors="coerce", format="mixed"
+                        )
+                        is_date = float(parsed.notna().mean()) >= 0.9
+
+                if is_date:
                     try:
-                        self.data[col] = pd.to_datetime(self.data[col], errors="coerce")
-                        self.logger.info(f"'{col}' → datetime")
+                        self.data[col] = self._to_datetime(col)
+                        report.append(f"'{col}' → datetime")
                         date_cols_converted += 1
                     except Exception as e:
                         self.logger.error(
@@ -171,68 +632,113 @@ class DataCleaner:
                         )
 
             if date_cols_converted == 0:
-                self.logger.info("Keine Datum-Spalten gefunden")
+                report.append("Keine Datum-Spalten gefunden")
 
             # 2. Numerische Spalten optimieren
-            self.logger.info("--- Numerische Spalten optimieren ---")
+            report.append("--- Numerische Spalten optimieren ---")
             numeric_cols = self.data.select_dtypes(
                 include=["float64", "float32"]
             ).columns
 
-            for col in numeric_cols:
-                # Prüfe ob die Spalte nur ganze Zahlen enthält (keine Dezimalstellen)
-                if self.data[col].dropna().apply(lambda x: x == int(x)).all():
-                    # Finde den passenden Integer-Typ basierend auf Min/Max
-                    col_min = self.data[col].min()
-                    col_max = self.data[col].max()
-
-                    if col_min >= 0:  # Unsigned integers für nicht-negative Werte
-                        if col_max < 256:
-                            self.data[col] = self.data[col].astype("Int8")
-                            self.logger.info(f"'{col}': Float64 → Int8 (0-255)")
-                        elif col_max < 65536:
-                            self.data[col] = self.data[col].astype("Int16")
-                            self.logger.info(f"'{col}': Float64 → Int16 (0-65k)")
-                        elif col_max < 4294967296:
-                            self.data[col] = self.data[col].astype("Int32")
-                            self.logger.info(f"'{col}': Float64 → Int32 (0-4B)")
-                        else:
-                            self.data[col] = self.data[col].astype("Int64")
-                            self.logger.info(f"'{col}': Float64 → Int64")
-                    else:  # Signed integers für negative Werte
-                        if col_min >= -128 and col_max < 128:
-                            self.data[col] = self.data[col].astype("Int8")
-                            self.logger.info(f"'{col}': Float64 → Int8 (-128 bis 127)")
-                        elif col_min >= -32768 and col_max < 32768:
-                            self.data[col] = self.data[col].astype("Int16")
-                            self.logger.info(f"'{col}': Float64 → Int16 (-32k bis 32k)")
-                        elif col_min >= -2147483648 and col_max < 2147483648:
-                            self.data[col] = self.data[col].astype("Int32")
-                            self.logger.info(f"'{col}': Float64 → Int32")
-                        else:
-                            self.data[col] = self.data[col].astype("Int64")
-                            self.logger.info(f"'{col}': Float64 → Int64")
-                else:
-                    self.logger.info(f"'{col}': Bleibt Float64 (hat Dezimalstellen)")
+            def _infer_col(col):
+                # Min/Max/Ganzzahl/Null-Check in EINEM numpy-Pass
+                col_min, col_max, is_int, has_nulls = _analyze_float(
+                    self.data[col].to_numpy()
+                )
+                if not is_int:
+                    return col, None, f"'{col}': Bleibt Float64 (hat Dezimalstellen)"
+
+                if col_min >= 0:  # Unsigned integers für nicht-negative Werte
+                    if col_max < 256:
+                        target, hint = "int8", "0-255"
+                    elif col_max < 65536:
+                        target, hint = "int16", "0-65k"
+                    elif col_max < 4294967296:
+                        target, hint = "int32", "0-4B"
+                    else:
+                        target, hint = "int64", ""
+                else:  # Signed integers für negative Werte
+                    if col_min >= -128 and col_max < 128:
+                        target, hint = "int8", "-128 bis 127"
+                    elif col_min >= -32768 and col_max < 32768:
+                        target, hint = "int16", "-32k bis 32k"
+                    elif col_min >= -2147483648 and col_max < 2147483648:
+                        target, hint = "int32", ""
+                    else:
+                        target, hint = "int64", ""
+
+                # Nullable Int (maskiert) nur wenn NaNs existieren —
+                # plain numpy-Ints rechnen 2-3x schneller und sparen
+                # das Masken-Byte pro Element
+                if has_nulls:
+                    target = target.capitalize()
+                suffix = f" ({hint})" if hint else ""
+                return col, target, f"'{col}': Float64 → {target}{suffix}"
+
+            # Die Scans sind pro Spalte unabhängig und numpy gibt den GIL
+            # frei → über die Spalten thread-parallelisieren. Ziel-Dtypes
+            # erst sammeln, dann EIN astype-Aufruf: vermeidet eine
+            # Block-Manager-Konsolidierung pro Spalte.
+            if len(numeric_cols) > 1:
+                workers = min(os.cpu_count() or 1, len(numeric_cols))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    infer_results = list(executor.map(_infer_col, numeric_cols))
+            else:
+                infer_results = [_infer_col(col) for col in numeric_cols]
+
+            new_dtypes = {}
+            for col, dtype, line in infer_results:
+                if dtype is not None:
+                    new_dtypes[col] = dtype
+                report.append(line)
 
             if len(numeric_cols) == 0:
-                self.logger.info("Keine numerischen Spalten zum Optimieren gefunden")
+                report.append("Keine numerischen Spalten zum Optimieren gefunden")
+
+            # 3. Object-Spalten mit wenigen eindeutigen Werten → category
+            # (int-Codes + kleines Dictionary statt Python-String-Pointer)
+            report.append("--- Kategorische Spalten optimieren ---")
+            # "string" mit abdecken: der object-Selektor matcht
+            # String-Dtype-Spalten (z.B. vom Arrow-Reader) nicht
+            object_cols = self.data.select_dtypes(include=["object", "string"]).columns
+            total_rows = len(self.data)
+            for col in object_cols:
+                if (
+                    total_rows > 0
+                    and self.data[col].nunique(dropna=False) / total_rows
+                    < self.category_threshold
+                ):
+                    new_dtypes[col] = "category"
+                    report.append(f"'{col}': object → category")
+
+            # Numerische Downcasts und category-Konvertierungen in EINEM
+            # astype: eine Block-Manager-Reorganisation statt einer pro Pass
+            if new_dtypes:
+                self.data = self.data.astype(new_dtypes, copy=False)
 
             # Memory Usage nachher
-            memory_after = self.data.memory_usage(deep=True).sum() / 1024**2  # in MB
+            memory_after = (
+                self.data.memory_usage(deep=self._verbose_memory).sum() / 1024**2
+            )  # in MB
             memory_saved = memory_before - memory_after
             memory_percent = (
                 (memory_saved / memory_before) * 100 if memory_before > 0 else 0
             )
 
-            self.logger.info("=== Ergebnis ===")
-            self.logger.info(f"Memory-Verbrauch nachher: {memory_after:.2f} MB")
-            self.logger.info(
-                f"Eingespart: {memory_saved:.2f} MB ({memory_percent:.1f}%)"
-            )
+            report.append("=== Ergebnis ===")
+            report.append(f"Memory-Verbrauch nachher: {memory_after:.2f} MB")
+            report.append(f"Eingespart: {memory_saved:.2f} MB ({memory_percent:.1f}%)")
+            if self.logger.isEnabledFor(logging.INFO):
+                report.append(f"Datentypen nachher:\n{self.data.dtypes}")
 
-            self.logger.info("Datentypen nachher:")
-            self.logger.info(f"\n{self.data.dtypes}")
+            # Gesamter Report als EIN Log-Record (join nur wenn INFO
+            # überhaupt emittiert wird)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("%s", "\n".join(report))
+
+            # Bereinigten Frame optional als Parquet cachen (für Reruns)
+            if self.use_parquet_cache:
+                self.cache_to_parquet()
 
             return self.data
 
@@ -253,10 +759,13 @@ class DataCleaner:
         table_name: Name der Zieltabelle
         """
         try:
+            from src.db import get_engine
             from src.db_connector import DatabaseConnector
 
-            db = DatabaseConnector()
-            db.save_dataframe(df, table_name, if_exists="replace")
+            # Geteilte, gepoolte Engine statt Verbindungsaufbau pro Aufruf
+            db = DatabaseConnector(engine=get_engine())
+            # COPY FROM STDIN statt to_sql-INSERTs (10-100x schneller)
+            db.copy_dataframe(df, table_name)
             db.close()
 
             self.logger.info(f"Daten erfolgreich in Tabelle '{table_name}' gespeichert")
@@ -265,6 +774,41 @@ class DataCleaner:
             self.logger.error(f"Fehler beim Speichern in Datenbank: {e}")
             raise
 
+    def save_to_parquet(
+        self,
+        df: pd.DataFrame,
+        path: str,
+        partition_cols: Optional[list] = None,
+    ) -> None:
+        """
+        Speichert bereinigte Daten als Parquet (für ELT/Analytics)
+
+        5-20x schneller als der PostgreSQL-Roundtrip und direkt
+        von Spark/DuckDB/BI-Tools lesbar. Mit partition_cols werden
+        Hive-partitionierte Verzeichnisse geschrieben (Predicate
+        Pushdown für Downstream-Reader).
+
+        Args:
+            df: Bereinigter DataFrame
+            path: Zieldatei bzw. Zielverzeichnis (bei Partitionierung)
+            partition_cols: Optionale Partitions-Spalten
+        """
+        try:
+            df.to_parquet(
+                path,
+                engine="pyarrow",
+                compression="zstd",
+                partition_cols=partition_cols,
+                index=False,
+            )
+            self.logger.info(
+                f"{len(df)} Zeilen als Parquet nach '{path}' geschrieben"
+            )
+
+        except Exception as e:
+            self.logger.error(f"Fehler beim Parquet-Schreiben: {e}")
+            raise
+
     def upsert_to_database(
         self,
         df: pd.DataFrame,
@@ -280,6 +824,7 @@ class DataCleaner:
             conflict_columns: Spalten für Unique Constraint
         """
         try:
+            from src.db import get_engine
             from src.db_connector import DatabaseConnector
 
             # Default Conflict Columns
@@ -290,7 +835,8 @@ class DataCleaner:
             if "TotalPrice" not in df.columns:
                 df["TotalPrice"] = df["Quantity"] * df["UnitPrice"]
 
-            db = DatabaseConnector()
+            # Geteilte, gepoolte Engine statt Verbindungsaufbau pro Aufruf
+            db = DatabaseConnector(engine=get_engine())
             db.upsert_dataframe(df, table_name, conflict_columns)
             db.close()
 
@@ -0,0 +1,39 @@
+"""
+Shared SQLAlchemy engine for the pipeline.
+Provides a cached, pooled engine so repeated saves reuse connections.
+"""
+from functools import lru_cache
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from src.config import get_db_config
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    Gibt die prozessweite SQLAlchemy Engine zurück (gecacht).
+
+    Die Engine wird genau einmal erstellt; der Connection-Pool
+    (pool_size=4, pool_pre_ping=True) amortisiert TCP- und
+    Auth-Handshakes über alle Pipeline-Schritte hinweg.
+    """
+    cfg = get_db_config()
+    connection_string = (
+        f"postgresql+psycopg2://{cfg.USER}:{cfg.PASSWORD}"
+        f"@{cfg.HOST}:{cfg.PORT}/{cfg.NAME}"
+    )
+    return create_engine(
+        connection_string,
+        pool_size=4,
+        pool_pre_ping=True,
+        # Batched executemany für den INSERT-Fallback-Pfad:
+        # psycopg2 fasst Parameter-Sets zu VALUES-Listen zusammen
+        # statt ein Statement pro Zeile zu schicken
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=10_000,
+        executemany_batch_page_size=500,
+        # Kompilierte Statements über Aufrufe hinweg cachen
+        query_cache_size=500,
+    )
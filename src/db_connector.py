@@ -2,8 +2,16 @@
 Database connector module for PostgreSQL operations.
 Handles database connections, upserts, and data persistence.
 """
+import io
 from typing import Optional
 import pandas as pd
+
+try:
+    import pyarrow as pa
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy import text
@@ -21,10 +29,19 @@ from src.logger import get_logger
 class DatabaseConnector:
     """Verwaltet Datenbankverbindungen mit SQLAlchemy"""
 
-    def __init__(self):
+    def __init__(self, engine: Optional[Engine] = None):
         self.logger = get_logger(__name__)  # ← Test JSON logging!
         self.engine: Optional[Engine] = None
-        self._connect()
+        # Nur selbst erstellte Engines werden in close() disposed —
+        # eine geteilte Engine (src.db.get_engine) überlebt den Connector,
+        # damit ihr Connection-Pool über mehrere Saves hinweg trägt
+        self._owns_engine = engine is None
+        if engine is not None:
+            # Geteilte Engine (z.B. aus src.db.get_engine) wiederverwenden
+            # statt pro Instanz einen neuen TCP+Auth-Handshake zu machen
+            self.engine = engine
+        else:
+            self._connect()
 
     def _connect(self) -> None:
         """Liest Credentials und erstellt SQLAlchemy Engine"""
@@ -44,7 +61,11 @@ class DatabaseConnector:
             raise
 
     def save_dataframe(
-        self, df: pd.DataFrame, table_name: str, if_exists: str = "replace"
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        if_exists: str = "replace",
+        method: str = "multi",
     ) -> None:
         """
         Speichert DataFrame in PostgreSQL
@@ -53,8 +74,40 @@ class DatabaseConnector:
             df: Pandas DataFrame
             table_name: Name der Zieltabelle
             if_exists: 'fail', 'replace', oder 'append'
+            method: 'multi' (parameterisierte INSERTs) oder 'copy'
+                (COPY FROM STDIN, 5-10x schneller bei grossen Frames)
         """
         try:
+            # Arrow-Tabellen direkt annehmen: zero-copy nach pandas
+            # (selbe Buffer) und über den COPY-Bulk-Pfad laden statt
+            # Zelle für Zelle durch to_sql zu boxen
+            if PYARROW_AVAILABLE and isinstance(df, pa.Table):
+                # if_exists unverändert durchreichen — 'fail' muss bei
+                # existierender Tabelle werfen statt sie zu ersetzen
+                self.copy_dataframe(
+                    df.to_pandas(self_destruct=True),
+                    table_name,
+                    if_exists=if_exists,
+                )
+                return
+
+            if method == "copy":
+                # Bulk-Pfad: delegiert an den COPY-Loader; if_exists
+                # durchreichen ('append' darf nicht ersetzen, 'fail'
+                # muss bei existierender Tabelle werfen)
+                self.copy_dataframe(df, table_name, if_exists=if_exists)
+                return
+
+            # PostgreSQL-Fastpath für Appends: COPY FROM STDIN statt
+            # parameterisierter INSERTs (eine Protokoll-Nachricht,
+            # Grössenordnungen schneller bei vielen Zeilen)
+            if (
+                if_exists == "append"
+                and getattr(self.engine.dialect, "name", None) == "postgresql"
+            ):
+                self.copy_dataframe(df, table_name, if_exists="append")
+                return
+
             df.to_sql(
                 name=table_name,
                 con=self.engine,
@@ -74,70 +127,240 @@ class DatabaseConnector:
             self.logger.error(f"Fehler beim Speichern in DB: {e}")
             raise
 
-    def upsert_dataframe(
-        self, df: pd.DataFrame, table_name: str, conflict_columns: list
+    @staticmethod
+    def _copy_in_chunks(cur, df: pd.DataFrame, copy_sql: str, chunksize: int) -> None:
+        """
+        Streamt einen DataFrame scheibchenweise per copy_expert.
+
+        Ein COPY pro Chunk statt einem Riesen-Buffer: begrenzt den
+        Speicher für die CSV-Serialisierung. ~10k Zeilen pro Batch ist
+        der Sweet Spot für PostgreSQL — darunter dominiert der
+        Roundtrip-Overhead, darüber bringt mehr kaum noch etwas.
+        Alle Chunks laufen in derselben Transaktion (Commit beim Caller).
+        """
+        for start in range(0, len(df), chunksize):
+            buf = io.StringIO()
+            df.iloc[start : start + chunksize].to_csv(
+                buf, index=False, header=False, na_rep="\\N"
+            )
+            buf.seek(0)
+            cur.copy_expert(copy_sql, buf)
+
+    def copy_dataframe(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        chunksize: int = 10_000,
+        if_exists: str = "replace",
     ) -> None:
         """
-        Upsert DataFrame in PostgreSQL - ZEILE FÜR ZEILE
+        Speichert DataFrame per COPY FROM STDIN (Bulk-Load)
+
+        COPY streamt die Daten als eine Protokoll-Nachricht statt
+        vieler parameterisierter INSERTs — 10-100x schneller bei
+        grossen DataFrames. Tabelle wird vorher neu angelegt
+        (if_exists='replace') oder nur bei Bedarf erstellt ('append').
 
         Args:
             df: Pandas DataFrame
             table_name: Name der Zieltabelle
-            conflict_columns: Liste der Spalten für UNIQUE Constraint
+            chunksize: Zeilen pro COPY-Batch
+            if_exists: 'fail', 'replace' oder 'append' (wird an to_sql
+                durchgereicht — 'fail' wirft bei existierender Tabelle)
         """
         try:
-            from sqlalchemy import Table, MetaData
-            from sqlalchemy.dialects.postgresql import insert
-
-            # Table Metadata laden
-            metadata = MetaData()
-            table = Table(table_name, metadata, autoload_with=self.engine)
-
-            # DataFrame in dict-Liste
-            records = df.to_dict("records")
-            total = len(records)
-
-            self.logger.info(f"Starte Upsert fuer {total} Zeilen in '{table_name}'")
-
-            # ZEILE FÜR ZEILE (robusteste Methode)
-            with self.engine.connect() as conn:
-                for i, record in enumerate(records, 1):
-                    # INSERT Statement für EINE Zeile
-                    stmt = insert(table).values(**record)
-
-                    # UPDATE Dictionary
-                    update_dict = {
-                        col.name: stmt.excluded[col.name]
-                        for col in table.columns
-                        if col.name not in conflict_columns and col.name != "id"
-                    }
-
-                    # UPSERT
-                    upsert_stmt = stmt.on_conflict_do_update(
-                        index_elements=conflict_columns, set_=update_dict
-                    )
+            # Schema anlegen (leerer Frame → nur CREATE TABLE);
+            # bei 'append' bleibt eine existierende Tabelle stehen
+            df.head(0).to_sql(
+                name=table_name, con=self.engine, if_exists=if_exists, index=False
+            )
 
-                    conn.execute(upsert_stmt)
+            columns = ", ".join(f'"{c}"' for c in df.columns)
+            copy_sql = (
+                f'COPY {table_name} ({columns}) '
+                f"FROM STDIN WITH (FORMAT CSV, NULL '\\N')"
+            )
 
-                    # Log alle 1000 Zeilen
-                    if i % 1000 == 0:
-                        conn.commit()
-                        self.logger.info(
-                            f"{i}/{total} Zeilen verarbeitet ({i/total*100:.1f}%)"
-                        )
+            # psycopg2 copy_expert über die Raw-Connection der Engine,
+            # alle Batches in EINER Transaktion
+            raw_conn = self.engine.raw_connection()
+            try:
+                with raw_conn.cursor() as cur:
+                    self._copy_in_chunks(cur, df, copy_sql, chunksize)
+                raw_conn.commit()
+            finally:
+                raw_conn.close()
 
-                # Final Commit
-                conn.commit()
+            self.logger.info(
+                f"{len(df)} Zeilen per COPY in Tabelle '{table_name}' gespeichert"
+            )
+
+        except Exception as e:
+            self.logger.error(f"Fehler beim COPY in DB: {e}")
+            raise
+
+    def upsert_dataframe(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        conflict_columns: list,
+        chunksize: int = 10_000,
+        method: str = "copy",
+    ) -> None:
+        """
+        Upsert DataFrame in PostgreSQL (idempotent)
+
+        Schneller Pfad: COPY in eine TEMP-Tabelle, dann EIN serverseitiges
+        INSERT ... ON CONFLICT DO UPDATE — statt einem Statement pro Zeile.
+        method='batched' erzwingt den batchweisen INSERT-Pfad für Fälle
+        in denen COPY nicht nutzbar ist (z.B. keine TEMP-Tabellen-Rechte).
+
+        Args:
+            df: Pandas DataFrame
+            table_name: Name der Zieltabelle
+            conflict_columns: Liste der Spalten für UNIQUE Constraint
+            chunksize: Zeilen pro COPY-Batch (nur COPY-Pfad)
+            method: 'copy' (COPY-Staging, Default) oder 'batched'
+        """
+        try:
+            if (
+                method == "copy"
+                and getattr(self.engine.dialect, "name", None) == "postgresql"
+            ):
+                self._upsert_via_copy(df, table_name, conflict_columns, chunksize)
+            else:
+                self._upsert_batched(df, table_name, conflict_columns)
 
             self.logger.info(
                 "Upsert abgeschlossen",
-                extra={"rows_total": total, "table_name": table_name},
+                extra={"rows_total": len(df), "table_name": table_name},
             )
 
         except Exception as e:
             self.logger.error(f"Fehler beim Upsert: {e}")
             raise
 
+    def _upsert_via_copy(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        conflict_columns: list,
+        chunksize: int = 10_000,
+    ) -> None:
+        """
+        Upsert über COPY-Staging: Daten per COPY in eine TEMP-Tabelle
+        streamen und mit einem einzigen INSERT ... ON CONFLICT in die
+        Zieltabelle mergen (eine Transaktion, kein Netzwerk-Roundtrip
+        pro Zeile).
+        """
+        total = len(df)
+        self.logger.info(
+            f"Starte COPY-Upsert fuer {total} Zeilen in '{table_name}'"
+        )
+
+        columns = ", ".join(f'"{c}"' for c in df.columns)
+        conflict = ", ".join(f'"{c}"' for c in conflict_columns)
+        update_cols = [
+            c for c in df.columns if c not in conflict_columns and c != "id"
+        ]
+        set_clause = ", ".join(f'"{c}" = EXCLUDED."{c}"' for c in update_cols)
+
+        raw_conn = self.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cur:
+                # Staging-Tabelle mit identischem Schema (fällt beim Commit weg)
+                cur.execute(
+                    f"CREATE TEMP TABLE _stage "
+                    f"(LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                self._copy_in_chunks(
+                    cur,
+                    df,
+                    f"COPY _stage ({columns}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')",
+                    chunksize,
+                )
+                cur.execute(
+                    f"INSERT INTO {table_name} ({columns}) "
+                    f"SELECT {columns} FROM _stage "
+                    f"ON CONFLICT ({conflict}) DO UPDATE SET {set_clause}"
+                )
+            raw_conn.commit()
+        finally:
+            raw_conn.close()
+
+    def _upsert_batched(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        conflict_columns: list,
+        batch_size: int = 1000,
+    ) -> None:
+        """
+        PostgreSQL-Upsert ohne COPY-Staging: batchweise über SQLAlchemy
+
+        Für Fälle in denen der COPY-Pfad nicht nutzbar ist (keine
+        TEMP-Tabellen-Rechte, method='batched'). Baut ein Statement im
+        PostgreSQL-Dialekt (INSERT ... ON CONFLICT) — auf anderen
+        Dialekten nicht kompilierbar.
+
+        Ein INSERT ... ON CONFLICT mit batch_size Zeilen pro Statement
+        statt einem Statement (und Netzwerk-Roundtrip) pro Zeile —
+        10-100x weniger Roundtrips bei grossen DataFrames.
+        """
+        import itertools
+
+        from sqlalchemy import Table, MetaData
+        from sqlalchemy.dialects.postgresql import insert
+
+        # Table Metadata laden
+        metadata = MetaData()
+        table = Table(table_name, metadata, autoload_with=self.engine)
+
+        total = len(df)
+        self.logger.info(f"Starte Batch-Upsert fuer {total} Zeilen in '{table_name}'")
+
+        # Update-Spalten EINMAL bestimmen (hängen nur vom Schema und
+        # conflict_columns ab, nicht vom Batch)
+        update_cols = [
+            col.name
+            for col in table.columns
+            if col.name not in conflict_columns and col.name != "id"
+        ]
+
+        # itertuples statt to_dict('records'): kein Voll-Materialisieren
+        # des Frames als Dict-Liste — Dicts entstehen nur pro Batch
+        columns = list(df.columns)
+        rows = df.itertuples(index=False, name=None)
+
+        with self.engine.connect() as conn:
+            done = 0
+            while True:
+                batch = [
+                    dict(zip(columns, row))
+                    for row in itertools.islice(rows, batch_size)
+                ]
+                if not batch:
+                    break
+
+                # EIN INSERT mit allen Zeilen des Batches; der
+                # excluded-Namespace gehört zum jeweiligen Statement
+                stmt = insert(table).values(batch)
+                # Nur der excluded-Lookup passiert pro Batch — die
+                # Spaltenauswahl steht schon fest
+                upsert_stmt = stmt.on_conflict_do_update(
+                    index_elements=conflict_columns,
+                    set_={c: stmt.excluded[c] for c in update_cols},
+                )
+
+                conn.execute(upsert_stmt)
+                conn.commit()
+
+                done += len(batch)
+                if done < total:
+                    self.logger.info(
+                        f"{done}/{total} Zeilen verarbeitet ({done/total*100:.1f}%)"
+                    )
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -150,8 +373,16 @@ class DatabaseConnector:
 
         connection_string = f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
-        # Engine erstellen
-        engine = create_engine(connection_string)
+        # Engine erstellen (mit batched executemany für INSERT-Fallbacks)
+        engine = create_engine(
+            connection_string,
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=10_000,
+            executemany_batch_page_size=500,
+            # Kompilierte Statements über Aufrufe hinweg cachen
+            # (wiederholte DDL/Queries werden nicht neu kompiliert)
+            query_cache_size=500,
+        )
 
         # Verbindung testen
         with engine.connect() as conn:
@@ -181,7 +412,12 @@ class DatabaseConnector:
             raise
 
     def close(self) -> None:
-        """Schließt Datenbankverbindung"""
-        if self.engine:
+        """
+        Schließt Datenbankverbindung.
+
+        Geteilte Engines werden NICHT disposed — deren Pool wird
+        prozessweit wiederverwendet (siehe src.db.get_engine).
+        """
+        if self.engine and self._owns_engine:
             self.engine.dispose()
             self.logger.info("Datenbankverbindung geschlossen")
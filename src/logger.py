@@ -4,10 +4,38 @@ Provides setup functions for text and JSON logging formats.
 """
 import logging
 import sys
+from logging.handlers import RotatingFileHandler
+from functools import lru_cache
 from typing import Optional
 from pythonjsonlogger import jsonlogger
 
 
+# Teure Record-Metadaten global abschalten: Thread-/Prozess-Lookups
+# kosten pro Log-Record — keine der Format-Strings dieser Pipeline
+# nutzt diese Felder (dokumentierte Flags; das private logging._srcfile
+# bleibt unangetastet, sonst verlieren AUCH fremde Logger filename/lineno)
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+# Formatter EINMAL beim Import erstellen statt pro setup-Aufruf
+# (Formatter sind zustandslos und können von allen Handlern geteilt werden)
+_TEXT_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+_JSON_FORMATTER = jsonlogger.JsonFormatter(
+    fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
+    rename_fields={"asctime": "timestamp"},
+)
+
+# Prozess-lokaler Logger-Cache: erspart bei wiederholten setup-Aufrufen
+# sowohl das logging._lock in getLogger als auch den Handler-Check
+_LOGGER_CACHE: dict = {}
+
+
 def setup_logger(
     name: str, level: int = logging.INFO, log_file: Optional[str] = None
 ) -> logging.Logger:
@@ -22,33 +50,42 @@ def setup_logger(
     Returns:
         Konfigurierter Logger
     """
+    key = ("text", name, level, log_file)
+    cached = _LOGGER_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     # Logger erstellen
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
     # Verhindere doppelte Handler bei mehrfachen Aufrufen
     if logger.handlers:
+        _LOGGER_CACHE[key] = logger
         return logger
 
-    # Formatter definieren (einheitliches Format für alle Logs)
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
     # Console Handler (Ausgabe im Terminal)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_TEXT_FORMATTER)
     logger.addHandler(console_handler)
 
     # Optional: File Handler (Ausgabe in Datei)
+    # delay=True öffnet die Datei erst beim ersten Record;
+    # Rotation verhindert unbegrenzt wachsende Logs
     if log_file:
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=64 * 1024 * 1024,
+            backupCount=3,
+            encoding="utf-8",
+            delay=True,
+        )
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_TEXT_FORMATTER)
         logger.addHandler(file_handler)
 
+    _LOGGER_CACHE[key] = logger
     return logger
 
 
@@ -58,6 +95,10 @@ def setup_json_logger(
     """
     Erstellt Logger mit JSON-Format (für Production/Monitoring)
     """
+    key = ("json", name, level, log_file)
+    cached = _LOGGER_CACHE.get(key)
+    if cached is not None:
+        return cached
 
     # Logger erstellen
     json_logger = logging.getLogger(name)
@@ -65,36 +106,44 @@ def setup_json_logger(
 
     # Verhindere doppelte Handler
     if json_logger.handlers:
+        _LOGGER_CACHE[key] = json_logger
         return json_logger
 
-    # Json Formatter erstellen
-    json_formatter = jsonlogger.JsonFormatter(
-        fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
-        rename_fields={"asctime": "timestamp"},
-    )
-
     # Console Handler mit JSON Formatter
     json_console_handler = logging.StreamHandler(sys.stdout)
     json_console_handler.setLevel(level)
-    json_console_handler.setFormatter(json_formatter)
+    json_console_handler.setFormatter(_JSON_FORMATTER)
     json_logger.addHandler(json_console_handler)
 
-    # Optional Handler mit JSON Formatter
+    # Optional Handler mit JSON Formatter (lazy open + Rotation,
+    # siehe setup_logger)
     if log_file:
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=64 * 1024 * 1024,
+            backupCount=3,
+            encoding="utf-8",
+            delay=True,
+        )
         file_handler.setLevel(level)
-        file_handler.setFormatter(json_formatter)
+        file_handler.setFormatter(_JSON_FORMATTER)
         json_logger.addHandler(file_handler)
 
+    _LOGGER_CACHE[key] = json_logger
     return json_logger
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """
     Gibt Logger zurück basierend auf LOG_FORMAT Environment Variable.
 
     LOG_FORMAT=json  → JSON-Logging (Production)
     LOG_FORMAT=text  → Text-Logging (Development)
+
+    Gecacht pro (name, level): wiederholte Aufrufe (jede
+    DataCleaner/DatabaseConnector-Instanz) überspringen Format-Lookup
+    und Handler-Setup komplett.
     """
     from src.config import LoggingConfig
 
@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the test suite.
+"""
+import os
+
+import pandas as pd
+import pytest
+
+_RETAIL_CSV = "data/online_retail.csv"
+
+
+@pytest.fixture(scope="session")
+def retail_df_min():
+    """
+    Lädt die Retail-CSV EINMAL pro Test-Session — und nur die Spalten,
+    die die Tests tatsächlich prüfen.
+
+    usecols lässt den Tokenizer die übrigen Felder überspringen —
+    keine Konvertierung, kein Speicher für ungenutzte Spalten. Tests
+    die echte Daten brauchen, nehmen dieses Fixture statt die gleichen
+    Bytes in jedem Test erneut zu tokenisieren.
+    """
+    if not os.path.exists(_RETAIL_CSV):
+        pytest.skip(f"Datensatz fehlt: {_RETAIL_CSV}")
+    return pd.read_csv(
+        _RETAIL_CSV, usecols=["InvoiceNo", "InvoiceDate", "CustomerID"]
+    )
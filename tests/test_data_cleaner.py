@@ -1,6 +1,8 @@
 """
 Tests for DataCleaner module.
 """
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 from src.data_cleaner import DataCleaner
@@ -30,10 +32,34 @@ def test_handle_missing_values_with_sample_data():
     cleaner.handle_missing_values()
     
     # Assert - Keine fehlenden Werte mehr!
-    assert cleaner.data.isnull().sum().sum() == 0
+    # (values.any() statt sum().sum(): eine numpy-Reduktion,
+    # keine Zwischen-Series)
+    assert not cleaner.data.isna().values.any()
     assert len(cleaner.data) == 4  # Alle Zeilen noch da
 
 
+def test_handle_missing_values_string_and_category_dtypes():
+    """Test Fill für string-/category-Spalten (die Retail-Dtypes)."""
+    # Arrange - Dtypes wie aus _RETAIL_DTYPES geladen
+    test_data = pd.DataFrame({
+        'Description': pd.Series(['A', None, 'A'], dtype='string'),
+        'Country': pd.Series(['UK', None, None], dtype='category'),
+        'Empty': pd.Series([None, None, None], dtype='category'),
+    })
+
+    cleaner = DataCleaner("dummy.csv")
+    cleaner.data = test_data
+
+    # Act
+    cleaner.handle_missing_values()
+
+    # Assert - Mode bzw. "Unknown" (leere category) gefüllt
+    assert not cleaner.data.isna().values.any()
+    assert cleaner.data['Description'].iloc[1] == 'A'
+    assert cleaner.data['Country'].iloc[1] == 'UK'
+    assert (cleaner.data['Empty'] == 'Unknown').all()
+
+
 def test_data_cleaner_with_empty_dataframe():
     """Test DataCleaner handles empty DataFrame gracefully."""
     empty_data = pd.DataFrame()
@@ -45,14 +71,22 @@ def test_data_cleaner_with_empty_dataframe():
     result = len(cleaner.data)
     assert result == 0
 
-def test_load_data_success():
-    """Test load_data() lädt CSV erfolgreich."""
+@patch.object(DataCleaner, "_read_csv_pandas")
+@patch.object(DataCleaner, "_read_csv_arrow")
+def test_load_data_success(mock_arrow, mock_pandas):
+    """Test load_data() lädt CSV erfolgreich (Reader gemockt, kein Disk-I/O)."""
     # Arrange
+    sample = pd.DataFrame({
+        'InvoiceNo': ['536365', '536366'],
+        'CustomerID': [17850.0, 17850.0],
+    })
+    mock_arrow.return_value = sample
+    mock_pandas.return_value = sample
     cleaner = DataCleaner("data/online_retail.csv")
-    
+
     # Act
     cleaner.load_data()
-    
+
     # Assert
     assert cleaner.data is not None
     assert len(cleaner.data) > 0
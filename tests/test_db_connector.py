@@ -3,27 +3,59 @@ Unit Tests für DatabaseConnector mit Mocking.
 Testet alle Methoden ohne echte Datenbankverbindung.
 """
 
+from types import SimpleNamespace
+
 import pytest
 import pandas as pd
 from unittest.mock import Mock, patch, MagicMock
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import OperationalError
 from src.db_connector import DatabaseConnector
 
 
+# Eine Config fuer alle Tests: SimpleNamespace statt fuenf
+# MagicMock.__setattr__-Durchlaeufe pro Test
+_CFG = SimpleNamespace(
+    HOST="localhost",
+    PORT="5432",
+    NAME="test_db",
+    USER="test_user",
+    PASSWORD="test_password",
+)
+
+
+@pytest.fixture(scope="module")
+def patched_connector():
+    """
+    Ein EINMAL verdrahteter Connector für alle Tests, die keine
+    Call-Counts auf der Engine-Erstellung prüfen.
+
+    Das Mock-Graph-Setup (Config-Patches + MagicMock-Engine) kostet
+    pro Test ein paar Millisekunden — bei geteiltem Fixture fällt es
+    nur einmal pro Modul an. Tests die assert_called_once auf
+    create_engine/dispose brauchen, bauen weiterhin lokal.
+    """
+    with patch("src.db_connector.DatabaseConfig", _CFG), patch(
+        "src.db_connector.create_engine"
+    ) as mock_create_engine:
+        # spec begrenzt das Attribut-Set (schnellere Lookups) und
+        # lässt Tippfehler gegen die echte API sofort auffliegen
+        mock_engine = MagicMock(spec=Engine)
+        mock_engine.dialect = MagicMock()
+        mock_connection = MagicMock(spec=Connection)
+        mock_engine.connect.return_value.__enter__.return_value = mock_connection
+        mock_create_engine.return_value = mock_engine
+
+        yield DatabaseConnector(), mock_engine, mock_connection
+
+
 class TestDatabaseConnector:
     """Test Suite für DatabaseConnector Klasse"""
 
-    @patch("src.db_connector.DatabaseConfig")
+    @patch("src.db_connector.DatabaseConfig", _CFG)
     @patch("src.db_connector.create_engine")
-    def test_init_creates_engine_successfully(self, mock_create_engine, mock_config):
+    def test_init_creates_engine_successfully(self, mock_create_engine):
         """Test dass __init__ eine Engine erstellt."""
-        # Arrange - Mock Config
-        mock_config.HOST = "localhost"
-        mock_config.PORT = "5432"
-        mock_config.NAME = "test_db"
-        mock_config.USER = "test_user"
-        mock_config.PASSWORD = "test_password"
-
         # Mock Engine mit MagicMock (unterstützt Context Manager)
         mock_engine = MagicMock()
         mock_connection = MagicMock()
@@ -39,23 +71,10 @@ class TestDatabaseConnector:
         assert connector.database == "test_db"
         mock_create_engine.assert_called_once()
 
-    @patch("src.db_connector.DatabaseConfig")
-    @patch("src.db_connector.create_engine")
-    def test_save_dataframe_success(self, mock_create_engine, mock_config):
+    def test_save_dataframe_success(self, patched_connector):
         """Test save_dataframe speichert DataFrame erfolgreich."""
         # Arrange
-        mock_config.HOST = "localhost"
-        mock_config.PORT = "5432"
-        mock_config.NAME = "test_db"
-        mock_config.USER = "test_user"
-        mock_config.PASSWORD = "test_password"
-
-        mock_engine = MagicMock()
-        mock_connection = MagicMock()
-        mock_engine.connect.return_value.__enter__.return_value = mock_connection
-        mock_create_engine.return_value = mock_engine
-
-        connector = DatabaseConnector()
+        connector, _, _ = patched_connector
 
         # Test DataFrame
         test_df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
@@ -75,24 +94,61 @@ class TestDatabaseConnector:
                 chunksize=1000,
             )
 
-    @patch("src.db_connector.DatabaseConfig")
+    @patch("src.db_connector.DatabaseConfig", _CFG)
     @patch("src.db_connector.create_engine")
-    def test_save_dataframe_raises_on_error(self, mock_create_engine, mock_config):
-        """Test save_dataframe wirft Exception bei Fehler."""
+    def test_save_dataframe_append_uses_copy_on_postgres(self, mock_create_engine):
+        """Test dass Appends auf PostgreSQL über COPY laufen."""
         # Arrange
-        mock_config.HOST = "localhost"
-        mock_config.PORT = "5432"
-        mock_config.NAME = "test_db"
-        mock_config.USER = "test_user"
-        mock_config.PASSWORD = "test_password"
-
         mock_engine = MagicMock()
         mock_connection = MagicMock()
         mock_engine.connect.return_value.__enter__.return_value = mock_connection
+        mock_engine.dialect.name = "postgresql"
+
+        # Raw-Connection + Cursor für den COPY-Pfad
+        mock_raw = MagicMock()
+        mock_cursor = MagicMock()
+        mock_raw.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_engine.raw_connection.return_value = mock_raw
         mock_create_engine.return_value = mock_engine
 
         connector = DatabaseConnector()
 
+        test_df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+
+        # Schema-Anlage (head(0).to_sql) mocken
+        with patch("pandas.DataFrame.to_sql"):
+            # Act
+            connector.save_dataframe(test_df, "test_table", if_exists="append")
+
+        # Assert - Daten gingen über copy_expert, nicht über to_sql
+        mock_cursor.copy_expert.assert_called_once()
+        mock_raw.commit.assert_called_once()
+
+    @pytest.mark.parametrize("mode", ["append", "fail"])
+    def test_save_dataframe_copy_method_forwards_if_exists(
+        self, patched_connector, mode
+    ):
+        """Test dass method='copy' if_exists an copy_dataframe durchreicht."""
+        # Arrange
+        connector, _, _ = patched_connector
+
+        test_df = pd.DataFrame({"col1": [1, 2, 3]})
+
+        # Act - copy_dataframe mocken, nur die Weiterleitung prüfen
+        with patch.object(connector, "copy_dataframe") as mock_copy:
+            connector.save_dataframe(
+                test_df, "test_table", if_exists=mode, method="copy"
+            )
+
+        # Assert - 'append' darf nicht im Default 'replace' landen,
+        # 'fail' nicht stillschweigend ersetzen
+        mock_copy.assert_called_once_with(test_df, "test_table", if_exists=mode)
+
+    def test_save_dataframe_raises_on_error(self, patched_connector):
+        """Test save_dataframe wirft Exception bei Fehler."""
+        # Arrange
+        connector, _, _ = patched_connector
+
         test_df = pd.DataFrame({"col1": [1, 2, 3]})
 
         # to_sql wirft Fehler
@@ -101,23 +157,10 @@ class TestDatabaseConnector:
             with pytest.raises(Exception, match="DB Error"):
                 connector.save_dataframe(test_df, "test_table")
 
-    @patch("src.db_connector.DatabaseConfig")
-    @patch("src.db_connector.create_engine")
-    def test_execute_query_returns_dataframe(self, mock_create_engine, mock_config):
+    def test_execute_query_returns_dataframe(self, patched_connector):
         """Test execute_query gibt DataFrame zurück."""
         # Arrange
-        mock_config.HOST = "localhost"
-        mock_config.PORT = "5432"
-        mock_config.NAME = "test_db"
-        mock_config.USER = "test_user"
-        mock_config.PASSWORD = "test_password"
-
-        mock_engine = MagicMock()
-        mock_connection = MagicMock()
-        mock_engine.connect.return_value.__enter__.return_value = mock_connection
-        mock_create_engine.return_value = mock_engine
-
-        connector = DatabaseConnector()
+        connector, _, _ = patched_connector
 
         # Mock pd.read_sql
         expected_df = pd.DataFrame({"id": [1, 2], "name": ["Alice", "Bob"]})
@@ -132,23 +175,10 @@ class TestDatabaseConnector:
             assert "id" in result.columns
             assert "name" in result.columns
 
-    @patch("src.db_connector.DatabaseConfig")
-    @patch("src.db_connector.create_engine")
-    def test_execute_query_raises_on_error(self, mock_create_engine, mock_config):
+    def test_execute_query_raises_on_error(self, patched_connector):
         """Test execute_query wirft Exception bei SQL Fehler."""
         # Arrange
-        mock_config.HOST = "localhost"
-        mock_config.PORT = "5432"
-        mock_config.NAME = "test_db"
-        mock_config.USER = "test_user"
-        mock_config.PASSWORD = "test_password"
-
-        mock_engine = MagicMock()
-        mock_connection = MagicMock()
-        mock_engine.connect.return_value.__enter__.return_value = mock_connection
-        mock_create_engine.return_value = mock_engine
-
-        connector = DatabaseConnector()
+        connector, _, _ = patched_connector
 
         # pd.read_sql wirft Fehler
         with patch(
@@ -158,17 +188,11 @@ class TestDatabaseConnector:
             with pytest.raises(Exception, match="Invalid SQL"):
                 connector.execute_query("INVALID SQL")
 
-    @patch("src.db_connector.DatabaseConfig")
+    @patch("src.db_connector.DatabaseConfig", _CFG)
     @patch("src.db_connector.create_engine")
-    def test_close_disposes_engine(self, mock_create_engine, mock_config):
+    def test_close_disposes_engine(self, mock_create_engine):
         """Test close() schließt die Engine."""
         # Arrange
-        mock_config.HOST = "localhost"
-        mock_config.PORT = "5432"
-        mock_config.NAME = "test_db"
-        mock_config.USER = "test_user"
-        mock_config.PASSWORD = "test_password"
-
         mock_engine = MagicMock()
         mock_connection = MagicMock()
         mock_engine.connect.return_value.__enter__.return_value = mock_connection
@@ -182,19 +206,11 @@ class TestDatabaseConnector:
         # Assert
         mock_engine.dispose.assert_called_once()
 
-    @patch("src.db_connector.DatabaseConfig")
+    @patch("src.db_connector.DatabaseConfig", _CFG)
     @patch("src.db_connector.create_engine")
-    def test_create_engine_with_retry_on_operational_error(
-        self, mock_create_engine, mock_config
-    ):
+    def test_create_engine_with_retry_on_operational_error(self, mock_create_engine):
         """Test dass _create_engine_with_retry bei OperationalError retried."""
         # Arrange
-        mock_config.HOST = "localhost"
-        mock_config.PORT = "5432"
-        mock_config.NAME = "test_db"
-        mock_config.USER = "test_user"
-        mock_config.PASSWORD = "test_password"
-
         # Beim ersten Aufruf: OperationalError
         # Beim zweiten Aufruf: Success
         mock_engine = MagicMock()
@@ -219,22 +235,16 @@ class TestDatabaseConnector:
 class TestDatabaseConnectorUpsert:
     """Separate Test-Klasse für komplexe Upsert-Logik"""
 
-    @patch("src.db_connector.DatabaseConfig")
+    @patch("src.db_connector.DatabaseConfig", _CFG)
     @patch("src.db_connector.create_engine")
     @patch("sqlalchemy.MetaData")
     @patch("sqlalchemy.Table")
     @patch("sqlalchemy.dialects.postgresql.insert")
     def test_upsert_dataframe_basic(
-        self, mock_insert, mock_table_class, mock_metadata, mock_create_engine, mock_config
+        self, mock_insert, mock_table_class, mock_metadata, mock_create_engine
     ):
         """Test upsert_dataframe Basis-Funktionalität."""
         # Arrange
-        mock_config.HOST = "localhost"
-        mock_config.PORT = "5432"
-        mock_config.NAME = "test_db"
-        mock_config.USER = "test_user"
-        mock_config.PASSWORD = "test_password"
-
         # Mock Engine & Connection mit MagicMock
         mock_engine = MagicMock()
         mock_connection = MagicMock()
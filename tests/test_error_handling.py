@@ -0,0 +1,45 @@
+"""
+Tests for DataCleaner error handling.
+Converted from the old top-level test_error_handling.py script.
+"""
+import pytest
+
+from src.data_cleaner import DataCleaner
+
+
+@pytest.mark.parametrize(
+    "path, expect_none",
+    [
+        ("data/nicht_vorhanden.csv", True),
+        ("data/online_retail.csv", False),
+    ],
+)
+def test_load_data_error_handling(path, expect_none, request, tmp_path):
+    """Test load_data() mit fehlender bzw. korrekter Datei."""
+    # Der Positiv-Fall schreibt den gecachten Session-Parse nach
+    # tmp_path und lädt WIRKLICH über load_data() — skippt sauber ohne
+    # Datensatz. Der Test prüft nur die Zeilenzahl, also reicht die
+    # schmale usecols-Variante (weniger Schreiben UND weniger Parsen)
+    if not expect_none:
+        df = request.getfixturevalue("retail_df_min")
+        path = str(tmp_path / "online_retail.csv")
+        df.to_csv(path, index=False)
+
+    cleaner = DataCleaner(path)
+    result = cleaner.load_data()
+
+    if expect_none:
+        assert result is None
+        assert cleaner.data is None
+    else:
+        assert result is not None
+        assert len(cleaner.data) == len(df)
+
+
+def test_methods_without_loaded_data():
+    """Test dass Methoden ohne geladene Daten None zurückgeben."""
+    cleaner = DataCleaner("data/online_retail.csv")
+
+    # Nicht laden, sondern direkt bereinigen
+    assert cleaner.handle_missing_values() is None
+    assert cleaner.correct_datatypes() is None
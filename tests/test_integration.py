@@ -12,30 +12,36 @@ Verifies:
 - Row count matches
 - No duplicates
 """
-import pandas as pd 
+import pandas as pd
+import pytest
 from src.data_cleaner import DataCleaner
 from src.db_connector import DatabaseConnector
 from sqlalchemy import text
 
 
+# Test-Daten EINMAL auf Modul-Ebene bauen; der Test arbeitet auf einer
+# Shallow-Copy (neue Block-Verwaltung, gleiche Buffer — die Cleaner-
+# Schritte weisen Spalten neu zu statt in-place zu mutieren)
+_INTEGRATION_SALES = pd.DataFrame({
+    'InvoiceNo': ['536365', '536366', '536367'],
+    'StockCode': ['85123A', '71053', '84406B'],
+    'Description': ['WHITE HANGING HEART', 'WHITE METAL LANTERN', 'CREAM CUPID HEARTS'],
+    'Quantity': [6, 6, 8],
+    'InvoiceDate': ['2010-12-01 08:26:00', '2010-12-01 08:28:00', '2010-12-01 08:34:00'],
+    'UnitPrice': [2.55, 3.39, 2.75],
+    'CustomerID': [17850.0, 17850.0, 17850.0],
+    'Country': ['United Kingdom', 'United Kingdom', 'United Kingdom']
+})
+
+
+@pytest.mark.serial
 def test_complete_pipeline():
     """Integration Test for pipeline"""
 
     # ARRANGE
-    integration_test_sales = pd.DataFrame({
-        'InvoiceNo': ['536365', '536366', '536367'],
-        'StockCode': ['85123A', '71053', '84406B'],
-        'Description': ['WHITE HANGING HEART', 'WHITE METAL LANTERN', 'CREAM CUPID HEARTS'],
-        'Quantity': [6, 6, 8],
-        'InvoiceDate': ['2010-12-01 08:26:00', '2010-12-01 08:28:00', '2010-12-01 08:34:00'],
-        'UnitPrice': [2.55, 3.39, 2.75],
-        'CustomerID': [17850.0, 17850.0, 17850.0],
-        'Country': ['United Kingdom', 'United Kingdom', 'United Kingdom']
-    })
-
-    # DataCleaner Istanz 
+    # DataCleaner Istanz
     cleaner = DataCleaner("dummy.csv")
-    cleaner.data = integration_test_sales
+    cleaner.data = _INTEGRATION_SALES.copy(deep=False)
 
     # DatabaseComector Instanz
     connector = DatabaseConnector()